@@ -1,4 +1,14 @@
+import time
+
+# Marcado antes dos demais imports para incluir o custo deles no tempo até a primeira renderização
+inicio_execucao = time.perf_counter()
+
 import streamlit as st
+from streamlit.logger import get_logger
+
+from dados import iniciar_aquecimento
+
+logger = get_logger(__name__)
 
 # Configuração da página principal (SÓ AQUI)
 st.set_page_config(
@@ -8,6 +18,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Pré-carrega bibliotecas e dados em segundo plano enquanto a página inicial é exibida
+iniciar_aquecimento()
+
 # Definição das páginas da aplicação
 paginas = {
     "Páginas": [
@@ -23,4 +36,14 @@ paginas = {
 
 # Executar a navegação
 pg = st.navigation(paginas)
-pg.run()
\ No newline at end of file
+pg.run()
+
+# Tempo até a primeira renderização (registrado uma vez por sessão).
+# Fica em st.session_state para que o scripts/medir_inicializacao.py possa lê-lo.
+if "primeira_renderizacao" not in st.session_state:
+    st.session_state["primeira_renderizacao"] = time.perf_counter() - inicio_execucao
+    logger.info(
+        "Primeira renderização de '%s' em %.2fs",
+        pg.title,
+        st.session_state["primeira_renderizacao"],
+    )
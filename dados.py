@@ -0,0 +1,112 @@
+import json
+import threading
+import time
+
+import streamlit as st
+from streamlit.logger import get_logger
+
+# --- Caminhos dos Arquivos de Dados ---
+CAMINHO_UFS = 'data/dados_dengue_ufs.parquet'
+CAMINHO_MUNICIPIOS = 'data/dados_dengue_municipios.parquet'
+CAMINHO_GEOJSON_MUNICIPIOS = 'data/geojs-100-mun.json'
+
+logger = get_logger(__name__)
+
+# --- Funções de Carregamento Compartilhadas ---
+# As funções abaixo não tratam erros: exceções não ficam no cache, então uma
+# falha no pré-carregamento é repetida (e exibida) quando a página pedir os dados.
+# O pandas é importado dentro das funções para não pesar na primeira renderização.
+# show_spinner=False: o pré-carregamento roda fora da sessão e não deve desenhar nada.
+
+@st.cache_data(show_spinner=False)
+def ler_dados_ufs():
+    """Lê os dados de dengue das UFs."""
+    import pandas as pd
+    return pd.read_parquet(CAMINHO_UFS)
+
+@st.cache_data(show_spinner=False)
+def ler_dados_municipios():
+    """Lê os dados de dengue dos municípios."""
+    import pandas as pd
+    return pd.read_parquet(CAMINHO_MUNICIPIOS)
+
+@st.cache_data(show_spinner=False)
+def resumir_dados_municipios():
+    """Calcula o resumo exibido na página inicial lendo só as colunas necessárias."""
+    import pandas as pd
+    df = pd.read_parquet(CAMINHO_MUNICIPIOS, columns=['Ano', 'Casos', 'Municipio'])
+    if df.empty:
+        return pd.DataFrame()
+    return pd.DataFrame([{
+        'total_anos': df['Ano'].nunique(),
+        'ano_inicio': df['Ano'].min(),
+        'ano_fim': df['Ano'].max(),
+        'total_casos': df['Casos'].sum(),
+        'total_municipios': df['Municipio'].nunique()
+    }])
+
+@st.cache_data(show_spinner=False)
+def agregar_estados_anual():
+    """Agrupa os dados das UFs por ano, garantindo um valor por estado/ano."""
+    return ler_dados_ufs().groupby(['UF', 'Sigla', 'Ano']).agg(
+        Casos=('Casos', 'sum'),
+        Taxa=('Taxa', 'mean') # Usando a média da taxa
+    ).reset_index()
+
+@st.cache_data(show_spinner=False)
+def agregar_municipios_anual():
+    """Agrupa os dados dos municípios por ano."""
+    return ler_dados_municipios().groupby(['UF', 'Codigo_Municipio', 'Municipio', 'Ano']).agg(
+        Casos=('Casos', 'sum'),
+        Taxa=('Taxa', 'mean')
+    ).reset_index()
+
+# cache_resource evita copiar (desserializar) o GeoJSON, que é grande, a cada execução
+@st.cache_resource(show_spinner=False)
+def ler_geojson_municipios():
+    """Lê o GeoJSON com a geometria dos municípios."""
+    with open(CAMINHO_GEOJSON_MUNICIPIOS, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# --- Pré-carregamento (warm-up) ---
+
+# Ordem de carregamento: primeiro o que a página inicial usa, depois o das demais páginas
+ETAPAS_AQUECIMENTO = [
+    resumir_dados_municipios,
+    ler_dados_municipios,
+    ler_dados_ufs,
+    agregar_estados_anual,
+    agregar_municipios_anual,
+    ler_geojson_municipios,
+]
+
+# Resultado de cada etapa: tempo em segundos ou a exceção que a interrompeu
+resultados_aquecimento = {}
+
+def _aquecer():
+    """Preenche o cache dos dados compartilhados e importa as bibliotecas de gráficos."""
+    inicio = time.perf_counter()
+    for etapa in ETAPAS_AQUECIMENTO:
+        inicio_etapa = time.perf_counter()
+        try:
+            etapa()
+        except Exception as e:
+            resultados_aquecimento[etapa.__name__] = e
+            logger.warning("Pré-carregamento de %s falhou: %s", etapa.__name__, e)
+            continue
+        resultados_aquecimento[etapa.__name__] = time.perf_counter() - inicio_etapa
+        logger.info("%s carregado em %.2fs", etapa.__name__, resultados_aquecimento[etapa.__name__])
+
+    # Por último, para não disputar o processador com os dados da página inicial
+    inicio_etapa = time.perf_counter()
+    import plotly.express  # noqa: F401
+    logger.info("plotly.express importado em %.2fs", time.perf_counter() - inicio_etapa)
+
+    logger.info("Pré-carregamento concluído em %.2fs", time.perf_counter() - inicio)
+
+@st.cache_resource(show_spinner=False)
+def iniciar_aquecimento():
+    """Dispara o pré-carregamento em segundo plano, uma única vez por processo."""
+    thread = threading.Thread(target=_aquecer, name="aquecimento-dados", daemon=True)
+    thread.start()
+    return thread
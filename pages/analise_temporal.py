@@ -2,35 +2,31 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+from dados import CAMINHO_MUNICIPIOS, CAMINHO_UFS, ler_dados_municipios, ler_dados_ufs
+
 # --- Configurações da Página ---
 # st.set_page_config(layout="wide") # Já deve estar no app.py
 
 # --- Função de Carregamento de Dados (SIMPLIFICADA) ---
 
-@st.cache_data
 def carregar_dados_municipios():
     """Carrega os dados de dengue dos municípios, sem converter datas."""
-    caminho_arquivo = 'data/dados_dengue_municipios.parquet'
     try:
-        # Apenas lê o arquivo, sem processamento de datas
-        df = pd.read_parquet(caminho_arquivo)
-        return df
+        # Leitura compartilhada e em cache (pré-carregada pelo app.py)
+        return ler_dados_municipios()
     except FileNotFoundError:
-        st.error(f"Arquivo de dados não encontrado: {caminho_arquivo}")
+        st.error(f"Arquivo de dados não encontrado: {CAMINHO_MUNICIPIOS}")
         return pd.DataFrame()
     except Exception as e:
         st.error(f"Ocorreu um erro ao carregar os dados: {e}")
         return pd.DataFrame()
 
-@st.cache_data
 def carregar_dados_ufs():
     """Carrega os dados de dengue das UFs."""
-    caminho_arquivo = 'data/dados_dengue_ufs.parquet'
     try:
-        df = pd.read_parquet(caminho_arquivo)
-        return df
+        return ler_dados_ufs()
     except FileNotFoundError:
-        st.error(f"Arquivo de dados de UFs não encontrado: {caminho_arquivo}")
+        st.error(f"Arquivo de dados de UFs não encontrado: {CAMINHO_UFS}")
         return pd.DataFrame()
     except Exception as e:
         st.error(f"Ocorreu um erro ao carregar os dados de UFs: {e}")
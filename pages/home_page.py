@@ -1,61 +1,28 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import os
-from datetime import datetime, timedelta
-
-# Função para carregar dados com pandas
-@st.cache_data
-def carregar_dados_ufs():
-    try:
-        return pd.read_parquet('data/dados_dengue_ufs.parquet')
-    except Exception as e:
-        st.error(f"Erro ao carregar dados de UFs: {e}")
-        return pd.DataFrame()
 
-@st.cache_data
-def carregar_dados_municipios():
-    try:
-        return pd.read_parquet('data/dados_dengue_municipios.parquet')
-    except Exception as e:
-        st.error(f"Erro ao carregar dados de municípios: {e}")
-        return pd.DataFrame()
+from dados import CAMINHO_MUNICIPIOS, resumir_dados_municipios
 
 # Função para carregar estatísticas gerais
-@st.cache_data
+# Sem cache aqui: o resumo já fica em cache em dados.py e uma falha na leitura
+# não deve ficar guardada, para ser tentada de novo na próxima execução.
 def carregar_estatisticas_gerais():
+    # Importado aqui para não atrasar a exibição do cabeçalho
+    import pandas as pd
+
     try:
-        # Carregar dados de UFs
-        df_ufs = carregar_dados_municipios()
-        if df_ufs.empty:
-            return pd.DataFrame({
-                'total_anos': [12],
-                'ano_inicio': [2014],
-                'ano_fim': [2025],
-                'total_casos': [5000000],
-                'total_municipios': [5000] # ADICIONADO: Valor padrão para consistência
-            })
-        
-        # Calcular estatísticas
-        stats = {
-            'total_anos': len(df_ufs['Ano'].unique()),
-            'ano_inicio': df_ufs['Ano'].min(),
-            'ano_fim': df_ufs['Ano'].max(),
-            'total_casos': df_ufs['Casos'].sum(),
-            'total_municipios': df_ufs['Municipio'].nunique()
-        }
-        
-        return pd.DataFrame([stats])
-        
+        return resumir_dados_municipios()
+    except FileNotFoundError:
+        st.error(f"Arquivo de dados de municípios não encontrado: {CAMINHO_MUNICIPIOS}")
     except Exception as e:
-        st.error(f"Erro ao calcular estatísticas: {e}")
-        return pd.DataFrame({
-            'total_anos': [12],
-            'ano_inicio': [2014],
-            'ano_fim': [2025],
-            'total_casos': [5000000],
-            'total_municipios': [5000] # ADICIONADO: Valor padrão para consistência
-        })
+        st.error(f"Erro ao carregar dados de municípios: {e}")
+
+    return pd.DataFrame({
+        'total_anos': [12],
+        'ano_inicio': [2014],
+        'ano_fim': [2025],
+        'total_casos': [5000000],
+        'total_municipios': [5000] # ADICIONADO: Valor padrão para consistência
+    })
 
 # Header principal
 st.markdown("""
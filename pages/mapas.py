@@ -1,54 +1,30 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import json
-import requests
 
-# --- Configurações da Página ---
-st.set_page_config(layout="wide")
+from dados import agregar_estados_anual, agregar_municipios_anual, ler_geojson_municipios
 
 # --- Funções de Carregamento de Dados ---
+# A leitura e a agregação ficam em dados.py (em cache e pré-carregadas pelo app.py)
 
-@st.cache_data
 def carregar_dados_estados():
     """Carrega os dados de dengue por estado e agrupa por ano."""
-    caminho_parquet_ufs = 'data/dados_dengue_ufs.parquet'
     try:
-        df_estados_raw = pd.read_parquet(caminho_parquet_ufs)
-        
-        # Agregação anual para garantir um valor por estado/ano
-        df_estados_anual = df_estados_raw.groupby(['UF', 'Sigla','Ano']).agg(
-            Casos=('Casos', 'sum'),
-            Taxa=('Taxa', 'mean') # Usando a média da taxa
-        ).reset_index()
-
-        
-        return df_estados_anual
+        return agregar_estados_anual()
     except Exception as e:
         st.error(f"Erro ao carregar ou agregar os dados dos estados: {e}")
         return pd.DataFrame()
 
-# (As outras funções de carregamento permanecem as mesmas)
-@st.cache_data
 def carregar_dados_municipios_anual():
-    caminho_parquet_mun = 'data/dados_dengue_municipios.parquet'
     try:
-        df_municipios = pd.read_parquet(caminho_parquet_mun)
-        df_anual = df_municipios.groupby(['UF', 'Codigo_Municipio', 'Municipio', 'Ano']).agg(
-            Casos=('Casos', 'sum'),
-            Taxa=('Taxa', 'mean')
-        ).reset_index()
-        return df_anual
+        return agregar_municipios_anual()
     except Exception as e:
         st.error(f"Erro ao carregar ou agregar os dados dos municípios: {e}")
         return pd.DataFrame()
 
-@st.cache_data
 def carregar_geojson_municipios():
-    caminho_geojson_mun = 'data/geojs-100-mun.json'
     try:
-        with open(caminho_geojson_mun, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return ler_geojson_municipios()
     except Exception as e:
         st.error(f"Erro ao carregar o GeoJSON dos municípios: {e}")
         return None
@@ -132,11 +108,11 @@ if not df_municipios_anual.empty:
         (df_municipios_anual['Ano'] == ano_selecionado_mun)
     ].copy()
     
-    if not df_mapa_mun.empty and carregar_geojson_municipios() is not None:
+    if not df_mapa_mun.empty and geojson_municipios is not None:
         df_mapa_mun['Codigo_Municipio'] = df_mapa_mun['Codigo_Municipio'].astype(str)
         fig_municipios = px.choropleth(
             df_mapa_mun,
-            geojson=carregar_geojson_municipios(),
+            geojson=geojson_municipios,
             locations='Codigo_Municipio',
             featureidkey='properties.id',
             color=metrica_selecionada_mun,
@@ -0,0 +1,150 @@
+"""Mede a inicialização a frio do app.py com o executor headless do Streamlit.
+
+Cada medição roda em um processo novo (caches vazios), com e sem o
+pré-carregamento, para comparar o tempo até a primeira renderização.
+Com o pré-carregamento, verifica também se todas as etapas funcionaram e se
+as demais páginas reaproveitam os dados do cache.
+
+Uso (a partir da raiz do repositório):
+    python scripts/medir_inicializacao.py [--repeticoes 3]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGINAS = ["pages/mapas.py", "pages/analise_temporal.py"]
+MODOS = {"com": "com pré-carregamento", "sem": "sem pré-carregamento"}
+
+
+def aguardar_aquecimento(timeout=300):
+    """Espera a thread de pré-carregamento iniciada pelo app.py terminar."""
+    for thread in threading.enumerate():
+        if thread.name == "aquecimento-dados":
+            thread.join(timeout)
+
+
+def medir(modo):
+    """Roda o app uma vez neste processo e devolve as medições."""
+    # Como o "streamlit run": diretório do app como diretório atual e no sys.path
+    os.chdir(RAIZ)
+    sys.path.insert(0, RAIZ)
+
+    from streamlit.testing.v1 import AppTest
+
+    import dados
+
+    if modo == "sem":
+        dados.iniciar_aquecimento = lambda: None
+
+    resultado = {"erros": [], "falhas_aquecimento": {}, "releituras": [], "paginas": {}}
+
+    inicio = time.perf_counter()
+    at = AppTest.from_file(os.path.join(RAIZ, "app.py"), default_timeout=300)
+    at.run()
+    resultado["primeira_renderizacao"] = time.perf_counter() - inicio
+    resultado["primeira_renderizacao_app"] = at.session_state["primeira_renderizacao"]
+    resultado["erros"] += [f"Página inicial: {e.message}" for e in at.exception]
+
+    aguardar_aquecimento()
+    if modo == "com":
+        resultado["falhas_aquecimento"] = {
+            nome: str(valor)
+            for nome, valor in dados.resultados_aquecimento.items()
+            if isinstance(valor, Exception)
+        }
+
+    # Importado só agora para que o custo do import entre na primeira renderização
+    import pandas as pd
+
+    # Conta as leituras de arquivos feitas pelas páginas: com o cache preenchido não deve haver nenhuma
+    read_parquet_original = pd.read_parquet
+    json_load_original = json.load
+
+    def read_parquet_contado(caminho, *args, **kwargs):
+        resultado["releituras"].append(caminho)
+        return read_parquet_original(caminho, *args, **kwargs)
+
+    def json_load_contado(arquivo, *args, **kwargs):
+        if getattr(arquivo, "name", None) == dados.CAMINHO_GEOJSON_MUNICIPIOS:
+            resultado["releituras"].append(arquivo.name)
+        return json_load_original(arquivo, *args, **kwargs)
+
+    pd.read_parquet = read_parquet_contado
+    json.load = json_load_contado
+    try:
+        for pagina in PAGINAS:
+            inicio = time.perf_counter()
+            at.switch_page(pagina).run()
+            resultado["paginas"][pagina] = time.perf_counter() - inicio
+            resultado["erros"] += [f"{pagina}: {e.message}" for e in at.exception]
+    finally:
+        pd.read_parquet = read_parquet_original
+        json.load = json_load_original
+
+    return resultado
+
+
+def medir_em_processo_novo(modo):
+    """Roda medir() em um subprocesso e devolve o resultado."""
+    processo = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--modo", modo],
+        capture_output=True,
+        text=True,
+    )
+    if processo.returncode != 0:
+        raise RuntimeError(f"A medição ({MODOS[modo]}) falhou:\n{processo.stderr}")
+    return json.loads(processo.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--modo", choices=MODOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.modo:
+        print(json.dumps(medir(args.modo)))
+        return 0
+
+    resultados = {modo: [] for modo in MODOS}
+    for _ in range(args.repeticoes):
+        for modo in MODOS:
+            resultados[modo].append(medir_em_processo_novo(modo))
+
+    # --- Comparação dos tempos ---
+    print(f"Tempo até a primeira renderização ({args.repeticoes} execuções a frio):")
+    for modo, execucoes in resultados.items():
+        tempos = [r["primeira_renderizacao"] for r in execucoes]
+        print(f"  {MODOS[modo]}: mediana {statistics.median(tempos):.2f}s "
+              f"({', '.join(f'{t:.2f}' for t in tempos)})")
+        for pagina in PAGINAS:
+            tempos = [r["paginas"][pagina] for r in execucoes]
+            print(f"    depois {pagina}: mediana {statistics.median(tempos):.2f}s")
+
+    # --- Verificações ---
+    problemas = []
+    for modo, execucoes in resultados.items():
+        for r in execucoes:
+            problemas += [f"Erro ({MODOS[modo]}): {erro}" for erro in r["erros"]]
+    for r in resultados["com"]:
+        problemas += [f"Pré-carregamento de {nome} falhou: {erro}"
+                      for nome, erro in r["falhas_aquecimento"].items()]
+        problemas += [f"Relido em vez de reaproveitado do cache: {caminho}"
+                      for caminho in r["releituras"]]
+
+    if problemas:
+        for problema in dict.fromkeys(problemas):
+            print(problema)
+        return 1
+    print("Pré-carregamento completo e dados reaproveitados do cache nas demais páginas.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())